@@ -0,0 +1,42 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from app.tools.deployment_tools import describe_cloud_function
+from app.tools.gcs_tools import (
+  list_gcs_objects,
+  list_gcs_objects_bulk,
+  read_gcs_jsonl_preview,
+  read_gcs_object,
+  read_gcs_objects_bulk,
+)
+from app.tools.logging_tools import query_function_logs, tail_function_logs
+from app.tools.pubsub_tools import (
+  PublisherFlushPlugin,
+  flush_pending_publishes,
+  trigger_scraper_pipeline,
+)
+
+__all__ = [
+  "PublisherFlushPlugin",
+  "describe_cloud_function",
+  "flush_pending_publishes",
+  "list_gcs_objects",
+  "list_gcs_objects_bulk",
+  "query_function_logs",
+  "read_gcs_jsonl_preview",
+  "read_gcs_object",
+  "read_gcs_objects_bulk",
+  "tail_function_logs",
+  "trigger_scraper_pipeline",
+]
@@ -0,0 +1,106 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Project settings and Google Cloud clients shared by the agent tools."""
+
+import functools
+import os
+import threading
+from typing import Optional
+
+import requests
+from google.cloud import functions_v2, pubsub_v1, storage
+from google.cloud.logging_v2.services.logging_service_v2 import LoggingServiceV2Client
+
+
+@functools.lru_cache(maxsize=1)
+def get_project_id() -> str:
+  project_id = os.environ.get("GCP_PROJECT_ID") or os.environ.get("GOOGLE_CLOUD_PROJECT")
+  if not project_id:
+    raise ValueError("GCP project ID is not configured in the environment.")
+  return project_id
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_region() -> str:
+  return os.environ.get("REGION") or os.environ.get("VERTEX_AI_LOCATION", "us-central1")
+
+
+def normalize_bucket_and_blob(bucket_name: str, blob_path: Optional[str] = None) -> tuple[str, Optional[str]]:
+  if blob_path and blob_path[:5] == "gs://":
+    bucket_part, _, object_part = blob_path[5:].partition("/")
+    return bucket_part, object_part or None
+  if bucket_name[:5] == "gs://":
+    return bucket_name[5:], blob_path
+  return bucket_name, blob_path
+
+
+@functools.lru_cache(maxsize=1)
+def _storage_client(project_id: str) -> storage.Client:
+  # Let the client resolve its own credentials (including the anonymous ones it
+  # uses for STORAGE_EMULATOR_HOST), then widen the pool on its session.
+  client = storage.Client(project=project_id)
+  client._http.mount("https://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+  return client
+
+
+def get_storage_client() -> storage.Client:
+  return _storage_client(get_project_id())
+
+
+@functools.lru_cache(maxsize=1)
+def get_logging_client() -> LoggingServiceV2Client:
+  return LoggingServiceV2Client()
+
+
+@functools.lru_cache(maxsize=1)
+def get_functions_client() -> functions_v2.FunctionServiceClient:
+  return functions_v2.FunctionServiceClient()
+
+
+_PUBLISHER: Optional[pubsub_v1.PublisherClient] = None
+_PUBLISHER_LOCK = threading.Lock()
+# Publishes issued within 50ms of each other are coalesced into one RPC.
+_PUBLISHER_BATCH_SETTINGS = pubsub_v1.types.BatchSettings(
+  max_messages=100,
+  max_latency=0.05,
+  max_bytes=1_000_000,
+)
+
+
+def get_publisher() -> pubsub_v1.PublisherClient:
+  """Return a process-wide publisher so publishes share one gRPC channel."""
+
+  global _PUBLISHER
+  if _PUBLISHER is None:
+    with _PUBLISHER_LOCK:
+      if _PUBLISHER is None:
+        _PUBLISHER = pubsub_v1.PublisherClient(
+          batch_settings=_PUBLISHER_BATCH_SETTINGS,
+          publisher_options=pubsub_v1.types.PublisherOptions(enable_message_ordering=False),
+        )
+  return _PUBLISHER
+
+
+def stop_publisher() -> bool:
+  """Flush and release the shared publisher; returns False if none was created."""
+
+  global _PUBLISHER
+  with _PUBLISHER_LOCK:
+    publisher, _PUBLISHER = _PUBLISHER, None
+  if publisher is None:
+    return False
+  publisher.stop()
+  return True
+
@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import functools
+import threading
+from typing import Any, Optional
+
+import cachetools
+from google.cloud import functions_v2
+
+from app.tools._common import get_default_region, get_functions_client, get_project_id
+
+_FUNCTION_METADATA_CACHE: cachetools.TTLCache = cachetools.TTLCache(maxsize=128, ttl=30)
+_FUNCTION_METADATA_LOCK = threading.Lock()
+
+
+def describe_cloud_function(
+  function_name: str,
+  location: Optional[str] = None,
+  fresh: bool = False,
+) -> dict[str, Any]:
+  """Return human-friendly metadata for a Cloud Function.
+
+  Results are cached for 30 seconds; pass fresh=True to re-check a deployment.
+  """
+
+  project_id = get_project_id()
+  resolved_location = location or get_default_region()
+  cache_key = (project_id, resolved_location, function_name)
+  if not fresh:
+    with _FUNCTION_METADATA_LOCK:
+      cached = _FUNCTION_METADATA_CACHE.get(cache_key)
+    if cached is not None:
+      return copy.deepcopy(cached)
+
+  metadata = _fetch_cloud_function_metadata(project_id, resolved_location, function_name)
+  with _FUNCTION_METADATA_LOCK:
+    _FUNCTION_METADATA_CACHE[cache_key] = metadata
+  return copy.deepcopy(metadata)
+
+
+@functools.lru_cache(maxsize=64)
+def _function_path(project_id: str, location: str, function_name: str) -> str:
+  return functions_v2.FunctionServiceClient.function_path(
+    project=project_id, location=location, function=function_name
+  )
+
+
+def _fetch_cloud_function_metadata(project_id: str, location: str, function_name: str) -> dict[str, Any]:
+  cloud_function = get_functions_client().get_function(
+    name=_function_path(project_id, location, function_name)
+  )
+  service_config = cloud_function.service_config
+  build_config = cloud_function.build_config
+
+  return {
+    "name": cloud_function.name,
+    "state": cloud_function.state.name if cloud_function.state else "STATE_UNSPECIFIED",
+    "update_time": cloud_function.update_time.isoformat() if cloud_function.update_time else None,
+    "service_account_email": service_config.service_account_email if service_config else None,
+    "available_memory": service_config.available_memory if service_config else None,
+    "max_instance_count": service_config.max_instance_count if service_config else None,
+    "min_instance_count": service_config.min_instance_count if service_config else None,
+    "ingress_settings": service_config.ingress_settings.name if service_config and service_config.ingress_settings else None,
+    "build_worker_pool": build_config.worker_pool if build_config else None,
+    "runtime": build_config.runtime if build_config else None,
+    "environment_variables": dict(service_config.environment_variables)
+    if service_config and service_config.environment_variables
+    else None,
+    "labels": dict(cloud_function.labels) if cloud_function.labels else None,
+  }
@@ -0,0 +1,186 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Generator
+from concurrent import futures
+from typing import Any, Optional
+
+import orjson
+from google.api_core import exceptions as api_exceptions
+from google.cloud import storage
+
+from app.tools._common import get_storage_client, normalize_bucket_and_blob
+
+
+def list_gcs_objects(bucket_name: str, prefix: str = "", limit: int = 20) -> list[dict[str, Any]]:
+  """List recent objects under a prefix."""
+
+  client = get_storage_client()
+  normalized_bucket, _ = normalize_bucket_and_blob(bucket_name)
+  bucket = client.bucket(normalized_bucket)
+  blobs = bucket.list_blobs(
+    prefix=prefix,
+    max_results=limit,
+    fields="items(name,size,updated,contentType),nextPageToken",
+  )
+
+  return [
+    {
+      "name": blob.name,
+      "size": blob.size,
+      "updated": blob.updated.isoformat() if blob.updated else None,
+      "content_type": blob.content_type,
+    }
+    for blob in blobs
+  ]
+
+
+def read_gcs_object(bucket_name: str, object_path: str, max_bytes: Optional[int] = None) -> str:
+  """Return the raw text content of a GCS object, optionally only its first max_bytes."""
+
+  client = get_storage_client()
+  bucket, blob_path = normalize_bucket_and_blob(bucket_name, object_path)
+  if not blob_path:
+    raise ValueError("object_path must include the blob name")
+  blob = client.bucket(bucket).blob(blob_path)
+  if max_bytes is None:
+    return blob.download_as_text()
+  if max_bytes <= 0:
+    raise ValueError("max_bytes must be positive")
+  try:
+    # Ranged reads skip checksums (the server only has the whole-object hash).
+    # gzip-encoded objects are decompressed like the full read; GCS ignores the
+    # range for them, so the result is sliced to max_bytes here.
+    content = blob.download_as_bytes(start=0, end=max_bytes - 1, checksum=None)
+  except api_exceptions.RequestRangeNotSatisfiable:
+    # Zero-byte objects cannot satisfy any range.
+    return ""
+  return content[:max_bytes].decode("utf-8", errors="replace")
+
+
+_BULK_MAX_WORKERS = 8
+
+
+_BULK_QUERY_KEYS = frozenset({"bucket_name", "prefix", "limit"})
+
+
+def _list_one(query: dict[str, Any]) -> dict[str, Any]:
+  unknown = sorted(set(query) - _BULK_QUERY_KEYS)
+  if unknown:
+    return {
+      "query": query,
+      "error": f"unknown query keys {unknown}; expected bucket_name, prefix, limit",
+    }
+  if "bucket_name" not in query:
+    return {"query": query, "error": "query is missing bucket_name"}
+  try:
+    return {"query": query, "objects": list_gcs_objects(**query)}
+  except Exception as exc:
+    return {"query": query, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def list_gcs_objects_bulk(queries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+  """List several bucket/prefix combinations concurrently.
+
+  Each query takes the list_gcs_objects arguments (bucket_name, and optionally
+  prefix and limit). Results come back in query order as {"query", "objects"},
+  or {"query", "error"} for a query that failed without affecting the others.
+  """
+
+  with futures.ThreadPoolExecutor(max_workers=_BULK_MAX_WORKERS) as executor:
+    return list(executor.map(_list_one, queries))
+
+
+def _read_one(uri: str, max_bytes: Optional[int]) -> dict[str, Any]:
+  if not uri.startswith("gs://"):
+    return {"uri": uri, "error": "object URI must start with gs://"}
+  try:
+    return {"uri": uri, "content": read_gcs_object("", uri, max_bytes=max_bytes)}
+  except Exception as exc:
+    return {"uri": uri, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def read_gcs_objects_bulk(object_uris: list[str], max_bytes: Optional[int] = None) -> list[dict[str, Any]]:
+  """Read several gs://bucket/object URIs concurrently.
+
+  Results come back in input order as {"uri", "content"}, or {"uri", "error"}
+  for an object that could not be read without affecting the others.
+  """
+
+  with futures.ThreadPoolExecutor(max_workers=_BULK_MAX_WORKERS) as executor:
+    return list(executor.map(lambda uri: _read_one(uri, max_bytes), object_uris))
+
+
+_PREVIEW_CHUNK_SIZE = 262144
+_PREVIEW_MAX_CHARS = 1 << 20
+
+
+def _iter_blob_lines(blob: storage.Blob, max_chars: int = _PREVIEW_MAX_CHARS) -> Generator[tuple[str, bool], None, None]:
+  """Yield (line, truncated) pairs from a UTF-8 blob, reading at most max_chars characters.
+
+  Lines are read with a size limit, so a single oversized line never downloads
+  more than the remaining budget; if the budget runs out mid-line, that partial
+  line is yielded with truncated=True and iteration stops.
+  """
+
+  remaining = max_chars
+  with blob.open(
+    "rt",
+    chunk_size=min(_PREVIEW_CHUNK_SIZE, max_chars),
+    encoding="utf-8",
+    errors="replace",
+  ) as stream:
+    while remaining > 0:
+      line = stream.readline(remaining)
+      if not line:
+        return
+      remaining -= len(line)
+      if line.endswith("\n"):
+        yield line[:-1], False
+        continue
+      yield line, remaining == 0 and stream.read(1) != ""
+      return
+
+
+def read_gcs_jsonl_preview(bucket_name: str, object_path: str, max_lines: int = 10) -> list[dict[str, Any]]:
+  """Return the first N JSONL rows to keep responses small.
+
+  Reading stops after about 1 MiB; a row cut off at that limit is returned as
+  {"line": ..., "truncated": True}.
+  """
+
+  client = get_storage_client()
+  bucket, blob_path = normalize_bucket_and_blob(bucket_name, object_path)
+  if not blob_path:
+    raise ValueError("object_path must include the blob name")
+  blob = client.bucket(bucket).blob(blob_path)
+
+  preview: list[dict[str, Any]] = []
+  lines = _iter_blob_lines(blob)
+  try:
+    for index, (line, truncated) in enumerate(lines):
+      if not line.strip():
+        continue
+      if truncated:
+        preview.append({"line": line, "truncated": True})
+        break
+      try:
+        preview.append(orjson.loads(line))
+      except orjson.JSONDecodeError:
+        preview.append({"line": line})
+      if index + 1 >= max_lines:
+        break
+  finally:
+    lines.close()
+  return preview
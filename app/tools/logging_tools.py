@@ -0,0 +1,139 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime as dt
+import itertools
+import time
+from collections.abc import Iterable
+from typing import Any, Optional, Protocol, cast
+
+from google.api_core import exceptions as api_exceptions
+from google.cloud.logging_v2.types import (
+  LogEntry,
+  TailLogEntriesRequest,
+  TailLogEntriesResponse,
+)
+from google.logging.type.log_severity_pb2 import LogSeverity
+from google.protobuf import json_format
+
+from app.tools._common import get_logging_client, get_project_id
+
+_FUNCTION_FILTER_TMPL = 'resource.type="cloud_function" AND resource.labels.function_name={fn}'
+_LOG_FILTER_TMPL = _FUNCTION_FILTER_TMPL + ' AND timestamp>="{ts}"'
+_LOG_FILTER_TMPL_SEV = _LOG_FILTER_TMPL + " AND severity>={sev}"
+
+
+def _log_entry_text(entry: LogEntry) -> str:
+  if entry.text_payload:
+    return entry.text_payload
+  # Convert through the raw protobuf: proto-plus only marshals the top level of a
+  # Struct, leaving nested values as MapComposite/RepeatedComposite objects.
+  entry_pb = LogEntry.pb(entry)
+  if entry_pb.HasField("json_payload"):
+    payload = json_format.MessageToDict(entry_pb.json_payload)
+    return str(payload.get("message", payload))
+  if entry_pb.HasField("proto_payload"):
+    try:
+      return str(dict(json_format.MessageToDict(entry_pb.proto_payload)))
+    except TypeError:
+      # The payload type is not registered in this process's descriptor pool.
+      return entry_pb.proto_payload.type_url
+  return ""
+
+
+def _entry_row(entry: LogEntry, function_name: str) -> dict[str, Any]:
+  return {
+    "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
+    "severity": LogSeverity.Name(entry.severity),
+    "function": function_name,
+    "text": _log_entry_text(entry),
+  }
+
+
+def _quote_filter_value(value: str) -> str:
+  escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+  return f'"{escaped}"'
+
+
+class _TailStream(Iterable[TailLogEntriesResponse], Protocol):
+  """The streaming-call iterator returned by tail_log_entries."""
+
+  def cancel(self) -> Any: ...
+
+
+def query_function_logs(
+  function_name: str,
+  minutes: int = 60,
+  severity: Optional[str] = None,
+  limit: int = 50,
+  substring_match: Optional[str] = None,
+  insert_id_after: Optional[str] = None,
+) -> list[dict[str, Any]]:
+  """Fetch recent log entries for a Cloud Function.
+
+  substring_match narrows results to entries whose text or JSON message contains
+  the given text. insert_id_after keeps only entries whose insertId sorts
+  lexically after the given value; insertIds are not ordered by time, so use
+  minutes (not this) to look for newer entries.
+  """
+
+  client = get_logging_client()
+  start = dt.datetime.fromtimestamp(time.time() - minutes * 60, tz=dt.timezone.utc)
+  start_iso = start.isoformat(timespec="seconds").replace("+00:00", "Z")
+  template = _LOG_FILTER_TMPL_SEV if severity else _LOG_FILTER_TMPL
+  log_filter = template.format_map(
+    {"fn": _quote_filter_value(function_name), "ts": start_iso, "sev": severity.upper() if severity else ""}
+  )
+  if substring_match:
+    quoted = _quote_filter_value(substring_match)
+    log_filter += f" AND (textPayload:{quoted} OR jsonPayload.message:{quoted})"
+  if insert_id_after:
+    log_filter += f" AND insertId>{_quote_filter_value(insert_id_after)}"
+
+  entries = client.list_log_entries(
+    request={
+      "resource_names": [f"projects/{get_project_id()}"],
+      "filter": log_filter,
+      "order_by": "timestamp desc",
+      "page_size": limit,
+    }
+  )
+  return [_entry_row(entry, function_name) for entry in itertools.islice(entries, limit)]
+
+
+def tail_function_logs(function_name: str, seconds: int = 60) -> list[dict[str, Any]]:
+  """Wait up to N seconds for fresh log entries from a Cloud Function.
+
+  Opens a Cloud Logging tail stream and returns as soon as the first batch of
+  new entries arrives, or an empty list if nothing is logged within the window.
+  """
+
+  client = get_logging_client()
+  request = TailLogEntriesRequest(
+    resource_names=[f"projects/{get_project_id()}"],
+    filter=_FUNCTION_FILTER_TMPL.format_map({"fn": _quote_filter_value(function_name)}),
+  )
+  responses = cast(
+    _TailStream,
+    client.tail_log_entries(requests=iter([request]), timeout=seconds),
+  )
+  try:
+    for response in responses:
+      if response.entries:
+        return [_entry_row(entry, function_name) for entry in response.entries]
+  except api_exceptions.DeadlineExceeded:
+    pass
+  finally:
+    responses.cancel()
+  return []
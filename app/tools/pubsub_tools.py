@@ -0,0 +1,144 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import atexit
+import logging
+import uuid
+from concurrent import futures
+from typing import Any, Optional
+
+import orjson
+from google.adk.plugins.base_plugin import BasePlugin
+
+from app.tools._common import get_project_id, get_publisher, stop_publisher
+
+_DEFAULT_SCRAPER_TOPIC = "scraping-requests"
+# Temporarily disabled so the agent cannot publish new scrape jobs.
+_SCRAPER_TRIGGER_ENABLED = False
+
+
+def _log_publish_result(future: futures.Future, correlation_id: str) -> None:
+  try:
+    message_id = future.result()
+  except Exception:
+    logging.exception("Publishing scraper request %s failed", correlation_id)
+    return
+  logging.info("Published scraper request %s as message %s", correlation_id, message_id)
+
+
+def _publish_scraper_request(
+  topic_name: Optional[str],
+  data: bytes,
+  wait: bool = False,
+) -> str:
+  """Publish an encoded scraper payload without blocking on the publish round-trip.
+
+  Returns a locally generated correlation id used in the publish logs, or the
+  server-assigned message id when ``wait`` is set.
+  """
+
+  publisher = get_publisher()
+  topic_path = publisher.topic_path(get_project_id(), topic_name or _DEFAULT_SCRAPER_TOPIC)
+  try:
+    future = publisher.publish(topic_path, data)
+  except RuntimeError:
+    # stop_publisher() may have swapped the shared client out after we fetched
+    # it; retry once on the replacement, but surface any other failure.
+    replacement = get_publisher()
+    if replacement is publisher:
+      raise
+    future = replacement.publish(topic_path, data)
+  if wait:
+    return future.result()
+  correlation_id = uuid.uuid4().hex
+  future.add_done_callback(lambda f: _log_publish_result(f, correlation_id))
+  return correlation_id
+
+
+def flush_pending_publishes() -> str:
+  """Wait for outstanding scraper publishes to be sent and release the publisher."""
+
+  if not stop_publisher():
+    return "No pending publishes."
+  return "Pending publishes flushed."
+
+
+class PublisherFlushPlugin(BasePlugin):
+  """Drains queued scraper publishes when the ADK runner shuts down."""
+
+  def __init__(self) -> None:
+    super().__init__(name="publisher_flush")
+
+  async def close(self) -> None:
+    await asyncio.to_thread(stop_publisher)
+
+
+# Agent Engine never closes its runner, so also drain on interpreter exit.
+atexit.register(stop_publisher)
+
+
+def _default_payload(keywords: Optional[list[str]], urls: Optional[list[str]]) -> dict[str, Any]:
+  return {
+    "keywords": keywords
+    or ["fenerbahce", "galatasaray", "mourinho", "transfer", "derbi"],
+    "urls": urls
+    or [
+      "https://www.fanatik.com.tr",
+      "https://www.ntvspor.net",
+      "https://www.trtspor.com.tr/haber/futbol",
+    ],
+    "scrape_depth": 1,
+    "persist": False,
+    "log_level": "INFO",
+  }
+
+
+_DEFAULT_PAYLOAD_BYTES = orjson.dumps(_default_payload(None, None))
+
+
+def _encode_scraper_payload(
+  keywords: Optional[list[str]],
+  urls: Optional[list[str]],
+  scrape_depth: int,
+  persist: bool,
+) -> bytes:
+  """Encode a scraper payload, reusing the pre-encoded canonical payload when possible."""
+
+  if keywords is None and urls is None and scrape_depth == 1 and not persist:
+    return _DEFAULT_PAYLOAD_BYTES
+  payload = _default_payload(keywords, urls)
+  payload["scrape_depth"] = scrape_depth
+  payload["persist"] = persist
+  return orjson.dumps(payload)
+
+
+def trigger_scraper_pipeline(
+  topic_name: Optional[str] = None,
+  keywords: Optional[list[str]] = None,
+  urls: Optional[list[str]] = None,
+  scrape_depth: int = 1,
+  persist: bool = False,
+  wait: bool = False,
+) -> str:
+  """Publish the canonical scraper test payload to the scraping requests topic.
+
+  Returns a local correlation id right away, or the server-assigned message id
+  when wait is set.
+  """
+
+  if not _SCRAPER_TRIGGER_ENABLED:
+    raise RuntimeError("trigger_scraper_pipeline is temporarily disabled")
+  data = _encode_scraper_payload(keywords, urls, scrape_depth, persist)
+  return _publish_scraper_request(topic_name, data, wait=wait)
@@ -0,0 +1,34 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import google.auth
+from google.auth.credentials import AnonymousCredentials
+
+# app/agent.py resolves default credentials at import time; unit tests run
+# offline, so hand it anonymous credentials and a fixed project instead.
+_default_credentials = mock.patch.object(
+    google.auth,
+    "default",
+    return_value=(AnonymousCredentials(), "test-project"),
+)
+
+
+def pytest_configure() -> None:
+    _default_credentials.start()
+
+
+def pytest_unconfigure() -> None:
+    _default_credentials.stop()
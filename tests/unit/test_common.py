@@ -0,0 +1,58 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+from app.tools._common import _storage_client, normalize_bucket_and_blob
+
+
+def test_normalize_plain_bucket_and_blob() -> None:
+    assert normalize_bucket_and_blob("bucket", "dir/object.json") == (
+        "bucket",
+        "dir/object.json",
+    )
+
+
+def test_normalize_strips_scheme_from_bucket() -> None:
+    assert normalize_bucket_and_blob("gs://bucket") == ("bucket", None)
+    assert normalize_bucket_and_blob("gs://bucket", "object") == ("bucket", "object")
+
+
+def test_normalize_blob_uri_overrides_bucket() -> None:
+    assert normalize_bucket_and_blob("ignored", "gs://other/dir/object.json") == (
+        "other",
+        "dir/object.json",
+    )
+
+
+def test_normalize_blob_uri_without_object() -> None:
+    assert normalize_bucket_and_blob("", "gs://bucket") == ("bucket", None)
+    assert normalize_bucket_and_blob("", "gs://bucket/") == ("bucket", None)
+
+
+def test_storage_client_keeps_emulator_credentials(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("STORAGE_EMULATOR_HOST", "http://localhost:9023")
+    _storage_client.cache_clear()
+    try:
+        client = _storage_client("test-project")
+    finally:
+        _storage_client.cache_clear()
+
+    assert isinstance(client._credentials, AnonymousCredentials)
+    assert (
+        client._http.get_adapter("https://storage.googleapis.com")._pool_maxsize == 32
+    )
@@ -0,0 +1,71 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterator
+from unittest import mock
+
+import pytest
+from google.cloud import functions_v2
+
+from app.tools import deployment_tools
+
+
+@pytest.fixture
+def functions_client(monkeypatch: pytest.MonkeyPatch) -> Iterator[mock.Mock]:
+    client = mock.Mock()
+    client.get_function.return_value = functions_v2.Function(
+        name="projects/test-project/locations/europe-west3/functions/fn",
+        labels={"team": "news"},
+    )
+    monkeypatch.setattr(deployment_tools, "get_functions_client", lambda: client)
+    deployment_tools._FUNCTION_METADATA_CACHE.clear()
+    yield client
+    deployment_tools._FUNCTION_METADATA_CACHE.clear()
+
+
+def test_describe_is_cached(functions_client: mock.Mock) -> None:
+    first = deployment_tools.describe_cloud_function("fn", location="europe-west3")
+    second = deployment_tools.describe_cloud_function("fn", location="europe-west3")
+
+    assert functions_client.get_function.call_count == 1
+    functions_client.get_function.assert_called_once_with(
+        name="projects/test-project/locations/europe-west3/functions/fn"
+    )
+    assert first == second
+    assert first["labels"] == {"team": "news"}
+
+
+def test_cached_result_is_a_copy(functions_client: mock.Mock) -> None:
+    first = deployment_tools.describe_cloud_function("fn", location="europe-west3")
+    first["state"] = "MUTATED"
+    first["labels"]["team"] = "mutated"
+
+    second = deployment_tools.describe_cloud_function("fn", location="europe-west3")
+
+    assert second["state"] == "STATE_UNSPECIFIED"
+    assert second["labels"] == {"team": "news"}
+
+
+def test_fresh_bypasses_cache(functions_client: mock.Mock) -> None:
+    deployment_tools.describe_cloud_function("fn", location="europe-west3")
+    deployment_tools.describe_cloud_function("fn", location="europe-west3", fresh=True)
+
+    assert functions_client.get_function.call_count == 2
+
+
+def test_cache_is_keyed_by_location(functions_client: mock.Mock) -> None:
+    deployment_tools.describe_cloud_function("fn", location="europe-west3")
+    deployment_tools.describe_cloud_function("fn", location="us-central1")
+
+    assert functions_client.get_function.call_count == 2
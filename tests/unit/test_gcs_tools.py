@@ -0,0 +1,113 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+from unittest import mock
+
+import pytest
+from google.api_core import exceptions
+
+from app.tools import gcs_tools
+
+
+def _fake_client(monkeypatch: pytest.MonkeyPatch, blob: mock.MagicMock) -> None:
+    client = mock.Mock()
+    client.bucket.return_value.blob.return_value = blob
+    monkeypatch.setattr(gcs_tools, "get_storage_client", lambda: client)
+
+
+def _text_blob(text: str) -> mock.MagicMock:
+    blob = mock.MagicMock()
+    blob.open.side_effect = lambda *args, **kwargs: io.StringIO(text)
+    return blob
+
+
+def test_preview_parses_rows_up_to_max_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    _fake_client(monkeypatch, _text_blob('{"a": 1}\nnot json\n{"b": 2}\n{"c": 3}\n'))
+
+    preview = gcs_tools.read_gcs_jsonl_preview("bucket", "rows.jsonl", max_lines=3)
+
+    assert preview == [{"a": 1}, {"line": "not json"}, {"b": 2}]
+
+
+def test_preview_keeps_rows_longer_than_4kib(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = "".join(json.dumps({"i": i, "body": "x" * 36_000}) + "\n" for i in range(20))
+    _fake_client(monkeypatch, _text_blob(rows))
+
+    preview = gcs_tools.read_gcs_jsonl_preview("bucket", "rows.jsonl", max_lines=3)
+
+    assert [row["i"] for row in preview] == [0, 1, 2]
+
+
+def test_preview_flags_row_cut_by_the_read_budget() -> None:
+    blob = _text_blob('{"a": 1}\n{"long": "' + "y" * 100 + '"}\n')
+
+    lines = list(gcs_tools._iter_blob_lines(blob, max_chars=20))
+
+    assert lines == [('{"a": 1}', False), ('{"long": "y', True)]
+    assert blob.open.call_args.kwargs["encoding"] == "utf-8"
+
+
+def test_preview_last_line_without_newline_is_not_truncated() -> None:
+    blob = _text_blob('{"a": 1}')
+
+    assert list(gcs_tools._iter_blob_lines(blob, max_chars=8)) == [('{"a": 1}', False)]
+
+
+def test_ranged_read_of_empty_object(monkeypatch: pytest.MonkeyPatch) -> None:
+    blob = mock.MagicMock()
+    blob.download_as_bytes.side_effect = exceptions.RequestRangeNotSatisfiable("416")
+    _fake_client(monkeypatch, blob)
+
+    assert gcs_tools.read_gcs_object("bucket", "empty.marker", max_bytes=10) == ""
+
+
+def test_ranged_read_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    blob = mock.MagicMock()
+    blob.download_as_bytes.return_value = "şampiyon".encode()
+    _fake_client(monkeypatch, blob)
+
+    assert gcs_tools.read_gcs_object("bucket", "obj", max_bytes=4) == "şam"
+    assert blob.download_as_bytes.call_args.kwargs["end"] == 3
+
+
+def test_bulk_read_reports_errors_per_item(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_read(
+        bucket_name: str, object_path: str, max_bytes: int | None = None
+    ) -> str:
+        if object_path.endswith("missing"):
+            raise exceptions.NotFound("no such object")
+        return "content"
+
+    monkeypatch.setattr(gcs_tools, "read_gcs_object", fake_read)
+
+    results = gcs_tools.read_gcs_objects_bulk(["gs://b/ok", "gs://b/missing", "b/ok"])
+
+    assert results[0] == {"uri": "gs://b/ok", "content": "content"}
+    assert results[1]["uri"] == "gs://b/missing"
+    assert results[1]["error"].startswith("NotFound")
+    assert results[2] == {"uri": "b/ok", "error": "object URI must start with gs://"}
+
+
+def test_bulk_list_rejects_unknown_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gcs_tools, "list_gcs_objects", lambda **query: [query])
+
+    results = gcs_tools.list_gcs_objects_bulk(
+        [{"bucket_name": "b", "prefix": "news_data/"}, {"bucket": "b"}, {"prefix": "x"}]
+    )
+
+    assert results[0]["objects"] == [{"bucket_name": "b", "prefix": "news_data/"}]
+    assert "unknown query keys ['bucket']" in results[1]["error"]
+    assert results[2]["error"] == "query is missing bucket_name"
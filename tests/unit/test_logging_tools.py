@@ -0,0 +1,139 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+from unittest import mock
+
+import pytest
+from google.cloud.logging_v2.types import LogEntry, TailLogEntriesResponse
+from google.protobuf import any_pb2, struct_pb2
+
+from app.tools import logging_tools
+
+
+@pytest.fixture
+def logging_client(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+    client = mock.Mock()
+    client.list_log_entries.return_value = iter([])
+    monkeypatch.setattr(logging_tools, "get_logging_client", lambda: client)
+    return client
+
+
+def _sent_filter(client: mock.Mock) -> str:
+    return client.list_log_entries.call_args.kwargs["request"]["filter"]
+
+
+def test_filter_without_severity(logging_client: mock.Mock) -> None:
+    logging_tools.query_function_logs("scraper_function", minutes=5)
+
+    log_filter = _sent_filter(logging_client)
+    assert log_filter.startswith(
+        'resource.type="cloud_function" AND '
+        'resource.labels.function_name="scraper_function" AND timestamp>="'
+    )
+    assert log_filter.endswith('Z"')
+    assert "severity" not in log_filter
+
+
+def test_function_name_is_quoted(logging_client: mock.Mock) -> None:
+    logging_tools.query_function_logs('fn" OR severity>=DEBUG')
+
+    assert 'function_name="fn\\" OR severity>=DEBUG" AND ' in _sent_filter(
+        logging_client
+    )
+
+
+def test_filter_with_severity_and_optional_clauses(logging_client: mock.Mock) -> None:
+    logging_tools.query_function_logs(
+        "scraper_function",
+        severity="error",
+        limit=7,
+        substring_match='say "hi"',
+        insert_id_after="abc",
+    )
+
+    request = logging_client.list_log_entries.call_args.kwargs["request"]
+    assert request["page_size"] == 7
+    assert request["resource_names"] == ["projects/test-project"]
+    assert request["filter"].endswith(
+        ' AND severity>=ERROR AND (textPayload:"say \\"hi\\"" OR '
+        'jsonPayload.message:"say \\"hi\\"") AND insertId>"abc"'
+    )
+
+
+def test_query_maps_entries_and_respects_limit(logging_client: mock.Mock) -> None:
+    logging_client.list_log_entries.return_value = iter(
+        [
+            LogEntry(text_payload="plain", severity=400),
+            LogEntry(json_payload={"message": "structured"}, severity=500),
+            LogEntry(text_payload="past the limit", severity=200),
+        ]
+    )
+
+    results = logging_tools.query_function_logs("fn", limit=2)
+
+    assert results == [
+        {"timestamp": None, "severity": "WARNING", "function": "fn", "text": "plain"},
+        {
+            "timestamp": None,
+            "severity": "ERROR",
+            "function": "fn",
+            "text": "structured",
+        },
+    ]
+
+
+def test_json_payload_without_message_is_a_plain_dict() -> None:
+    entry = LogEntry(json_payload={"batch": {"ids": ["a", "b"]}})
+
+    assert logging_tools._log_entry_text(entry) == "{'batch': {'ids': ['a', 'b']}}"
+
+
+def test_proto_payload_is_rendered() -> None:
+    payload = any_pb2.Any()
+    payload.Pack(struct_pb2.Struct(fields={"k": struct_pb2.Value(string_value="v")}))
+    unknown = any_pb2.Any(type_url="type.googleapis.com/example.Unregistered")
+
+    assert "'k': 'v'" in logging_tools._log_entry_text(LogEntry(proto_payload=payload))
+    assert (
+        logging_tools._log_entry_text(LogEntry(proto_payload=unknown))
+        == "type.googleapis.com/example.Unregistered"
+    )
+    assert logging_tools._log_entry_text(LogEntry()) == ""
+
+
+def test_tail_returns_first_batch_of_entries(logging_client: mock.Mock) -> None:
+    responses: Any = mock.MagicMock()
+    responses.__iter__.return_value = iter(
+        [
+            TailLogEntriesResponse(),
+            TailLogEntriesResponse(
+                entries=[LogEntry(text_payload="fresh", severity=200)]
+            ),
+        ]
+    )
+    logging_client.tail_log_entries.return_value = responses
+
+    results = logging_tools.tail_function_logs("fn", seconds=5)
+
+    assert results == [
+        {"timestamp": None, "severity": "INFO", "function": "fn", "text": "fresh"}
+    ]
+    call = logging_client.tail_log_entries.call_args.kwargs
+    assert call["timeout"] == 5
+    [request] = list(call["requests"])
+    assert request.filter == (
+        'resource.type="cloud_function" AND resource.labels.function_name="fn"'
+    )
+    responses.cancel.assert_called_once()
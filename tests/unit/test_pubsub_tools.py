@@ -0,0 +1,99 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import mock
+
+import pytest
+
+from app.tools import pubsub_tools
+
+
+def test_default_payload_is_pre_encoded() -> None:
+    encoded = pubsub_tools._encode_scraper_payload(None, None, 1, False)
+
+    assert encoded is pubsub_tools._DEFAULT_PAYLOAD_BYTES
+    assert json.loads(encoded) == pubsub_tools._default_payload(None, None)
+
+
+def test_overrides_are_encoded() -> None:
+    encoded = pubsub_tools._encode_scraper_payload(["derbi"], None, 2, True)
+
+    payload = json.loads(encoded)
+    assert payload["keywords"] == ["derbi"]
+    assert payload["scrape_depth"] == 2
+    assert payload["persist"] is True
+
+
+def test_trigger_is_disabled() -> None:
+    with pytest.raises(RuntimeError, match="temporarily disabled"):
+        pubsub_tools.trigger_scraper_pipeline()
+
+
+def test_trigger_publishes_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    publisher = mock.Mock()
+    publisher.topic_path.return_value = "projects/test-project/topics/scraping-requests"
+    publisher.publish.return_value.result.return_value = "message-1"
+    monkeypatch.setattr(pubsub_tools, "_SCRAPER_TRIGGER_ENABLED", True)
+    monkeypatch.setattr(pubsub_tools, "get_publisher", lambda: publisher)
+
+    assert pubsub_tools.trigger_scraper_pipeline(wait=True) == "message-1"
+    publisher.publish.assert_called_once_with(
+        "projects/test-project/topics/scraping-requests",
+        pubsub_tools._DEFAULT_PAYLOAD_BYTES,
+    )
+
+    correlation_id = pubsub_tools.trigger_scraper_pipeline()
+    assert len(correlation_id) == 32
+    publisher.publish.return_value.add_done_callback.assert_called_once()
+
+
+def test_publish_retries_once_after_concurrent_stop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stopped = mock.Mock()
+    stopped.topic_path.return_value = "projects/test-project/topics/scraping-requests"
+    stopped.publish.side_effect = RuntimeError("Cannot publish on a stopped publisher.")
+    replacement = mock.Mock()
+    replacement.publish.return_value.result.return_value = "message-2"
+    publishers = iter([stopped, replacement])
+    monkeypatch.setattr(pubsub_tools, "get_publisher", lambda: next(publishers))
+
+    assert pubsub_tools._publish_scraper_request(None, b"{}", wait=True) == "message-2"
+    replacement.publish.assert_called_once_with(
+        "projects/test-project/topics/scraping-requests", b"{}"
+    )
+
+
+def test_publish_error_on_current_publisher_is_raised(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    publisher = mock.Mock()
+    publisher.publish.side_effect = RuntimeError("boom")
+    monkeypatch.setattr(pubsub_tools, "get_publisher", lambda: publisher)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pubsub_tools._publish_scraper_request(None, b"{}")
+
+
+@pytest.mark.asyncio
+async def test_flush_plugin_stops_publisher_on_close(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stop_publisher = mock.Mock(return_value=True)
+    monkeypatch.setattr(pubsub_tools, "stop_publisher", stop_publisher)
+
+    await pubsub_tools.PublisherFlushPlugin().close()
+
+    stop_publisher.assert_called_once_with()